@@ -0,0 +1,94 @@
+"""
+Compression ratio of stored job descriptions on real captured postings
+
+Reports raw UTF-8 bytes against compression without a dictionary and with the
+shared POSTING_DICTIONARY, per posting and in total, for a directory of saved
+job pages (.html, reduced to text the way the dashboard does) or plain-text
+descriptions (.txt).
+
+Do not point this at benchmarks/fixtures: those pages were written for the load
+test and paraphrase the dictionary, so their ratios are far higher than real
+postings will give.
+
+Usage:
+    python benchmarks/compression_ratio.py ~/captured_postings
+    python benchmarks/compression_ratio.py ~/captured_postings --codec zlib-d1 --verbose
+"""
+
+import argparse
+import os
+import sys
+import zlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from job_index import ZLIB_CODEC, ZSTD_CODEC, compress_text, zstandard  # noqa: E402
+
+
+def posting_text(path):
+    """Visible text of a saved page, or the file itself for .txt"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    if not path.lower().endswith(('.html', '.htm')):
+        return content
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    for tag in soup(['script', 'style', 'noscript']):
+        tag.decompose()
+    return soup.get_text('\n', strip=True)
+
+
+def plain_size(data, codec):
+    """Compressed size at the same level as compress_text(), without the shared dictionary"""
+    if codec == ZSTD_CODEC:
+        return len(zstandard.ZstdCompressor(level=10).compress(data))
+    return len(zlib.compress(data, 9))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure description compression on captured postings')
+    parser.add_argument('directory', help='folder of captured .html / .htm / .txt postings')
+    parser.add_argument('--codec', choices=(ZLIB_CODEC, ZSTD_CODEC),
+                        default=ZSTD_CODEC if zstandard else ZLIB_CODEC)
+    parser.add_argument('--verbose', action='store_true', help='print one line per posting')
+    args = parser.parse_args()
+
+    if os.path.abspath(args.directory) == os.path.join(BENCH_DIR, 'fixtures'):
+        print('warning: benchmarks/fixtures paraphrase the dictionary; ratios will be inflated', file=sys.stderr)
+    if args.codec == ZSTD_CODEC and zstandard is None:
+        parser.error('zstd-d1 needs zstandard: pip install zstandard')
+
+    paths = sorted(
+        os.path.join(args.directory, name) for name in os.listdir(args.directory)
+        if name.lower().endswith(('.html', '.htm', '.txt'))
+    )
+    if not paths:
+        parser.error(f'no .html or .txt postings in {args.directory}')
+
+    totals = {'raw': 0, 'plain': 0, 'dict': 0, 'stored': 0}
+    for path in paths:
+        data = posting_text(path).encode('utf-8')
+        sizes = {
+            'raw': len(data),
+            'plain': plain_size(data, args.codec),
+            'dict': len(compress_text(data.decode('utf-8'), args.codec)[1]),
+        }
+        # JobIndex keeps text as-is when compressing would make it bigger
+        sizes['stored'] = min(sizes['raw'], sizes['dict'])
+        for name, size in sizes.items():
+            totals[name] += size
+        if args.verbose:
+            print(f"{os.path.basename(path):<40} {sizes['raw']:>8} {sizes['plain']:>8} {sizes['dict']:>8}")
+
+    count = len(paths)
+    print(f"{count} postings, codec {args.codec}")
+    print(f"{'':<16} {'bytes/posting':>14} {'ratio':>7}")
+    for label, name in (('raw', 'raw'), ('no dictionary', 'plain'),
+                        ('shared dict', 'dict'), ('stored', 'stored')):
+        ratio = totals['raw'] / totals[name] if totals[name] else 0
+        print(f"{label:<16} {totals[name] / count:>14.0f} {ratio:>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+Multi-session load test for the Streamlit dashboard
+
+Starts the stub ATS server, then drives N simulated dashboard sessions
+(streamlit.testing.v1.AppTest, all in this process like a real server) through
+analyze job -> generate script -> mark as applied, for each concurrency level.
+Reports throughput, per-step tail latency, why flows failed, and CPU / memory
+over time.
+
+The stub serves the synthetic pages in benchmarks/fixtures unless --pages-dir
+points at real captured pages.
+
+Usage:
+    python benchmarks/load_test.py --sessions 1,4,8,16 --duration 30 --latency-ms 200 --error-rate 0.02
+    python benchmarks/load_test.py --sessions 8 --csv load_curves.csv
+    python benchmarks/load_test.py --sessions 8 --pages-dir ~/captured_pages
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(os.path.dirname(BENCH_DIR), 'streamlit_app.py')
+sys.path.insert(0, BENCH_DIR)
+
+from stub_ats_server import FIXTURES_DIR, StubATSServer  # noqa: E402
+
+# Path templates appended to the stub server URL, one per stubbed platform
+JOB_PATHS = (
+    '/jobs.lever.co/acme/{id}',
+    '/boards.greenhouse.io/acme/jobs/{id}',
+    '/acme.wd5.myworkdayjobs.com/en-US/careers/job/{id}',
+    '/www.glassdoor.com/job-listing/{id}',
+)
+
+PROFILE = {
+    'First Name': 'Load',
+    'Last Name': 'Tester',
+    'Email': 'load.tester@example.com',
+    'Phone': '+1-555-000-0000',
+}
+
+STEPS = ('load', 'analyze', 'mark_applied')
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def rss_bytes():
+    """Current resident set size; falls back to the peak where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Sampler(threading.Thread):
+    """Samples process CPU % and RSS at a fixed interval"""
+
+    def __init__(self, interval=0.5):
+        super().__init__(name='load-test-sampler', daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.level = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        start = last_wall = time.perf_counter()
+        last_cpu = time.process_time()
+        while not self._stop_event.wait(self.interval):
+            wall, cpu = time.perf_counter(), time.process_time()
+            self.samples.append({
+                'level': self.level,
+                'elapsed_s': round(wall - start, 2),
+                'cpu_percent': round(100 * (cpu - last_cpu) / (wall - last_wall), 1),
+                'rss_mb': round(rss_bytes() / 1e6, 1),
+            })
+            last_wall, last_cpu = wall, cpu
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def run_flow(base_url, timings):
+    """One session from first page load to a tracked application.
+
+    Returns None on success, otherwise why it failed as 'step: reason'.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    job_url = base_url + random.choice(JOB_PATHS).format(id=uuid.uuid4())
+    step = 'load'
+    try:
+        start = time.perf_counter()
+        at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+        timings['load'].append(time.perf_counter() - start)
+        if at.exception:
+            return f'{step}: app exception'
+
+        for label, value in list(PROFILE.items()) + [('Job Application URL', job_url)]:
+            next(t for t in at.text_input if t.label == label).input(value)
+
+        step = 'analyze'
+        start = time.perf_counter()
+        next(b for b in at.button if 'Analyze' in b.label).click().run()
+        timings['analyze'].append(time.perf_counter() - start)
+        if at.exception:
+            return f'{step}: app exception'
+        if at.error:
+            return f'{step}: error shown'
+        if not at.code:
+            return f'{step}: no script'
+
+        step = 'mark_applied'
+        start = time.perf_counter()
+        next(b for b in at.button if 'Mark as Applied' in b.label).click().run()
+        timings['mark_applied'].append(time.perf_counter() - start)
+        if at.exception:
+            return f'{step}: app exception'
+        if len(at.session_state['applications']) != 1:
+            return f'{step}: not tracked'
+    except Exception as e:
+        return f'{step}: {type(e).__name__}'
+    return None
+
+
+def run_level(base_url, sessions, duration):
+    timings = defaultdict(list)
+    outcomes = {'ok': 0, 'failed': 0}
+    failures = Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def session_loop():
+        while time.perf_counter() < deadline:
+            local = defaultdict(list)
+            failure = run_flow(base_url, local)
+            with lock:
+                outcomes['failed' if failure else 'ok'] += 1
+                if failure:
+                    failures[failure] += 1
+                for step, values in local.items():
+                    timings[step].extend(values)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=session_loop, name=f'session-{i}') for i in range(sessions)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return timings, outcomes, failures, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the dashboard against a stub ATS server')
+    parser.add_argument('--sessions', default='1,4,8', help='comma-separated concurrency levels')
+    parser.add_argument('--duration', type=float, default=20, help='seconds per concurrency level')
+    parser.add_argument('--latency-ms', type=float, default=100, help='stub server response latency')
+    parser.add_argument('--jitter-ms', type=float, default=50)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of stub responses that fail')
+    parser.add_argument('--sample-interval', type=float, default=0.5)
+    parser.add_argument('--csv', help='write the CPU/memory samples to this file')
+    parser.add_argument('--pages-dir', default=FIXTURES_DIR,
+                        help='real captured pages to serve instead of the synthetic fixtures')
+    args = parser.parse_args()
+
+    # Keep the load test's analyses out of the real job index
+    os.environ.setdefault('JOB_INDEX_PATH', os.path.join(tempfile.mkdtemp(prefix='load-test-'), 'job_index.db'))
+
+    server = StubATSServer(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        pages_dir=args.pages_dir,
+    ).start()
+    sampler = Sampler(args.sample_interval)
+    sampler.start()
+
+    header = f"{'sessions':>8} {'ok':>6} {'failed':>6} {'flows/s':>8}"
+    for step in STEPS:
+        header += f" {step + ' p50/p95/p99 ms':>30}"
+    header += f" {'cpu % avg':>9} {'rss MB max':>10}  failures"
+    rows = []
+
+    for level in [int(n) for n in args.sessions.split(',')]:
+        sampler.level = level
+        timings, outcomes, failures, elapsed = run_level(server.base_url, level, args.duration)
+        level_samples = [s for s in sampler.samples if s['level'] == level]
+        row = f"{level:>8} {outcomes['ok']:>6} {outcomes['failed']:>6} {outcomes['ok'] / elapsed:>8.2f}"
+        for step in STEPS:
+            p50, p95, p99 = (percentile(timings[step], p) * 1000 for p in (50, 95, 99))
+            row += f" {f'{p50:.0f} / {p95:.0f} / {p99:.0f}':>30}"
+        cpu = sum(s['cpu_percent'] for s in level_samples) / len(level_samples) if level_samples else float('nan')
+        rss = max((s['rss_mb'] for s in level_samples), default=float('nan'))
+        row += f" {cpu:>9.0f} {rss:>10.0f}  "
+        row += ', '.join(f'{reason} x{count}' for reason, count in failures.most_common()) or '-'
+        rows.append(row)
+        print(f"finished {level} sessions: {outcomes['ok']} ok, {outcomes['failed']} failed", file=sys.stderr)
+
+    sampler.stop()
+    server.shutdown()
+
+    print(f"\nstub latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, error rate {args.error_rate:.1%}, "
+          f"{server.requests_served} requests ({server.errors_injected} injected errors)")
+    print(header)
+    for row in rows:
+        print(row)
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['level', 'elapsed_s', 'cpu_percent', 'rss_mb'])
+            writer.writeheader()
+            writer.writerows(sampler.samples)
+        print(f"\nCPU/memory curves written to {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-session memory benchmark for tracked applications and uploaded files
+
+Compares the old layout (a list of dicts per session plus a private copy of
+the resume bytes) with ApplicationTable and the shared BlobStore.
+
+Two cases are reported: every session uploading the same resume (the best case
+for BlobStore, which then holds it once) and a different resume per session,
+where only the columnar table saves memory.
+
+Usage:
+    python benchmarks/session_memory.py --sessions 20 --applications 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from records import Application, ApplicationTable, BlobStore, STATUSES  # noqa: E402
+
+PLATFORMS = ('Lever', 'Greenhouse', 'Workday', 'Glassdoor')
+
+
+def fake_rows(count, seed):
+    """Rows built from fresh strings, like values coming out of requests/widgets"""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    for i in range(count):
+        company = f"company {rng.randint(1, 2000)}".title()
+        yield {
+            'url': f"https://jobs.lever.co/{company.lower().replace(' ', '-')}/{rng.getrandbits(128):032x}",
+            'company': company,
+            'title': f"Senior Data Scientist {i % 50}",
+            'platform': ''.join(rng.choice(PLATFORMS)),
+            'date': (start + timedelta(minutes=rng.randint(0, 500000))).strftime("%Y-%m-%d %H:%M"),
+            'status': ''.join(rng.choice(STATUSES)),
+        }
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--applications', type=int, default=5000)
+    parser.add_argument('--resume-kb', type=int, default=512)
+    args = parser.parse_args()
+
+    shared = os.urandom(args.resume_kb * 1024)
+    cases = (
+        ('same resume in every session', [shared] * args.sessions),
+        ('different resume per session', [os.urandom(args.resume_kb * 1024) for _ in range(args.sessions)]),
+    )
+
+    print(f"{args.sessions} sessions x {args.applications} applications, {args.resume_kb} KB resume")
+    for case, resumes in cases:
+        def before():
+            sessions = []
+            for s in range(args.sessions):
+                sessions.append({
+                    'applications': list(fake_rows(args.applications, s)),
+                    # file_uploader.read() hands every session its own copy
+                    'resume_content': bytes(bytearray(resumes[s])),
+                })
+            return sessions
+
+        def after():
+            blobs = BlobStore()
+            sessions = []
+            for s in range(args.sessions):
+                table = ApplicationTable(Application(**row) for row in fake_rows(args.applications, s))
+                sessions.append({
+                    'applications': table,
+                    'resume_digest': blobs.put(bytes(bytearray(resumes[s]))),
+                })
+            return sessions, blobs
+
+        old = measure(before)
+        new = measure(after)
+        print(f"\n{case}")
+        print(f"{'layout':<28}{'total MB':>12}{'per session KB':>18}")
+        for name, total in (('dicts + private bytes', old), ('columnar + shared blobs', new)):
+            print(f"{name:<28}{total / 1e6:>12.1f}{total / args.sessions / 1024:>18.0f}")
+        print(f"reduction: {old / new:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Stub ATS server for load testing - serves job pages locally
+
+Any path containing a platform host is answered with that platform's page, e.g.:
+    /jobs.lever.co/acme/<id>             -> fixtures/lever.html
+    /boards.greenhouse.io/acme/jobs/<id> -> fixtures/greenhouse.html
+    /acme.wd5.myworkdayjobs.com/<id>     -> fixtures/workday.html
+    /www.glassdoor.com/job/<id>          -> fixtures/glassdoor.html
+and the same path ending in /apply gets the platform's *_apply.html page.
+Because the platform host stays in the URL, detect_platform() still works.
+
+The pages in fixtures/ are synthetic: hand-written to look like each platform's
+markup, not captured from live boards. Pass --pages-dir with a folder of real
+captures (same file names) to load test against real markup.
+
+Usage:
+    python benchmarks/stub_ats_server.py --port 8800 --latency-ms 150 --error-rate 0.02
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+PLATFORM_HOSTS = (
+    ('lever', 'lever.co'),
+    ('greenhouse', 'greenhouse.io'),
+    ('workday', 'workday'),
+    ('glassdoor', 'glassdoor'),
+)
+
+
+def load_pages(directory=FIXTURES_DIR):
+    pages = {}
+    for name, _ in PLATFORM_HOSTS:
+        for suffix in ('', '_apply'):
+            with open(os.path.join(directory, f'{name}{suffix}.html'), 'rb') as f:
+                pages[name + suffix] = f.read()
+    return pages
+
+
+class StubATSServer(ThreadingHTTPServer):
+    """HTTP server with configurable latency and error injection"""
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, error_status=503, pages_dir=FIXTURES_DIR):
+        super().__init__(address, StubATSHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.pages = load_pages(pages_dir)
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._counter_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve from a daemon thread and return self"""
+        threading.Thread(target=self.serve_forever, name='stub-ats', daemon=True).start()
+        return self
+
+
+class StubATSHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _page(self):
+        path = self.path.split('?', 1)[0].lower()
+        for name, host in PLATFORM_HOSTS:
+            if host in path:
+                return self.server.pages[name + ('_apply' if path.rstrip('/').endswith('/apply') else '')]
+        return None
+
+    def _respond(self, send_body):
+        server = self.server
+        delay = server.latency_ms + random.uniform(-server.jitter_ms, server.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        with server._counter_lock:
+            server.requests_served += 1
+            inject_error = random.random() < server.error_rate
+            if inject_error:
+                server.errors_injected += 1
+
+        page = self._page()
+        if inject_error:
+            status, body = server.error_status, b'Service Unavailable'
+        elif page is None:
+            status, body = 404, b'Not Found'
+        else:
+            status, body = 200, page
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve ATS job pages for load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--pages-dir', default=FIXTURES_DIR,
+                        help='folder of captured pages (lever.html, lever_apply.html, ...); '
+                             'defaults to the synthetic fixtures')
+    args = parser.parse_args()
+
+    server = StubATSServer(
+        (args.host, args.port), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, error_status=args.error_status, pages_dir=args.pages_dir,
+    )
+    print(f'Stub ATS server on {server.base_url} (Ctrl+C to stop)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+History Export/Import - Bulk CSV and Parquet files for applications and analyzed jobs
+
+Rows are written and read in fixed-size chunks, so memory stays flat no matter
+how large the history is. Imports upsert by canonical job key. The files can be
+queried directly for reporting, e.g.:
+
+    pandas.read_parquet('jobs.parquet')
+    duckdb.sql("SELECT platform, count(*) FROM 'applications.csv' GROUP BY 1")
+
+The analyzed-jobs index can also be exported/imported from the command line:
+
+    python history_io.py export jobs.parquet
+    python history_io.py import jobs.csv
+"""
+
+import argparse
+import csv
+import io
+import sys
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional, only needed for Parquet
+    pyarrow = None
+
+from records import Application, canonical_job_key
+
+CHUNK_ROWS = 5000
+
+APPLICATION_FIELDS = ('job_key', 'url', 'company', 'title', 'platform', 'date', 'status')
+JOB_FIELDS = ('job_key', 'url', 'platform', 'title', 'company', 'location', 'salary',
+              'analyzed_at', 'description', 'questions')
+
+FORMATS = ('csv', 'parquet') if pyarrow else ('csv',)
+
+MIME_TYPES = {'csv': 'text/csv', 'parquet': 'application/vnd.apache.parquet'}
+
+# Full descriptions easily exceed the csv module's default 128 KB field limit
+CSV_FIELD_LIMIT = 2 ** 31 - 1
+
+
+def format_for(filename):
+    """'csv' or 'parquet' from a file name"""
+    fmt = filename.rsplit('.', 1)[-1].lower()
+    if fmt not in ('csv', 'parquet'):
+        raise ValueError(f'Unsupported file type: {filename} (use .csv or .parquet)')
+    if fmt == 'parquet' and pyarrow is None:
+        raise ValueError('Parquet support needs pyarrow: pip install pyarrow')
+    return fmt
+
+
+def iter_application_chunks(table, chunk_rows=CHUNK_ROWS):
+    """Export rows of an ApplicationTable, chunk_rows at a time"""
+    for start in range(0, len(table), chunk_rows):
+        chunk = []
+        for i in range(start, min(start + chunk_rows, len(table))):
+            row = table[i].to_dict()
+            row['job_key'] = canonical_job_key(row['url'])
+            chunk.append(row)
+        yield chunk
+
+
+def write_chunks(chunks, fields, fmt, fileobj):
+    """Stream chunks of row dicts to a binary file object; returns the number of rows"""
+    rows = 0
+    if fmt == 'csv':
+        text = io.TextIOWrapper(fileobj, encoding='utf-8', newline='')
+        writer = csv.DictWriter(text, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+        text.detach()
+    elif fmt == 'parquet':
+        schema = pyarrow.schema([(name, pyarrow.string()) for name in fields])
+        with pyarrow.parquet.ParquetWriter(fileobj, schema, compression='zstd') as writer:
+            for chunk in chunks:
+                # One row group per chunk keeps both the writer and later readers bounded
+                writer.write_table(pyarrow.Table.from_pylist(chunk, schema=schema))
+                rows += len(chunk)
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+    return rows
+
+
+def read_chunks(fileobj, fmt, chunk_rows=CHUNK_ROWS):
+    """Yield lists of row dicts (string values) from a binary CSV or Parquet file object"""
+    if fmt == 'csv':
+        csv.field_size_limit(CSV_FIELD_LIMIT)
+        text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        chunk = []
+        for row in csv.DictReader(text):
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        text.detach()
+    elif fmt == 'parquet':
+        for batch in pyarrow.parquet.ParquetFile(fileobj).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pylist()
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+
+
+def import_applications(table, chunks):
+    """Upsert rows into an ApplicationTable, returns (added, updated, skipped)"""
+    added = updated = skipped = 0
+    for chunk in chunks:
+        for row in chunk:
+            try:
+                app = Application(**{name: str(row.get(name) or '') for name in Application.__slots__})
+                if not app.url:
+                    raise ValueError('Missing url')
+                # upsert() validates platform, status and date before touching the table
+                if table.upsert(app):
+                    added += 1
+                else:
+                    updated += 1
+            except (TypeError, ValueError):
+                skipped += 1
+    return added, updated, skipped
+
+
+def import_jobs(index, chunks):
+    """Upsert rows into a JobIndex one transaction per chunk, returns (added, updated, skipped)"""
+    added = updated = skipped = 0
+    for chunk in chunks:
+        rows = [{k: str(v) if v is not None else '' for k, v in row.items()} for row in chunk if row.get('url')]
+        skipped += len(chunk) - len(rows)
+        chunk_added, chunk_updated = index.upsert_rows(rows)
+        added += chunk_added
+        updated += chunk_updated
+    return added, updated, skipped
+
+
+def main():
+    from job_index import DEFAULT_INDEX_PATH, JobIndex
+
+    parser = argparse.ArgumentParser(description='Export or import the analyzed jobs index')
+    parser.add_argument('action', choices=('export', 'import'))
+    parser.add_argument('path', help='.csv or .parquet file')
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='job index database')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    fmt = format_for(args.path)
+    index = JobIndex(args.index)
+    if args.action == 'export':
+        with open(args.path, 'wb') as f:
+            rows = write_chunks(index.iter_rows(args.chunk_rows), JOB_FIELDS, fmt, f)
+        print(f'Exported {rows} jobs to {args.path}')
+    else:
+        with open(args.path, 'rb') as f:
+            added, updated, skipped = import_jobs(index, read_chunks(f, fmt, args.chunk_rows))
+        print(f'Imported {args.path}: {added} added, {updated} updated, {skipped} skipped')
+    index.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+"""
+Job Index - Full-text search over analyzed job postings
+Every analyzed posting is stored in SQLite and indexed with FTS5.
+Full descriptions and apply-page questions are kept compressed and only
+decompressed on demand; search results carry a short plain-text preview.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+from records import canonical_job_key
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used when zstandard is not installed
+    zstandard = None
+
+DEFAULT_INDEX_PATH = os.environ.get('JOB_INDEX_PATH', os.path.join('data', 'job_index.db'))
+
+SCHEMA_VERSION = 1
+
+# Relative bm25 weights for title, company, location, description, questions
+RANK_WEIGHTS = (10.0, 5.0, 2.0, 1.0, 1.0)
+
+PREVIEW_CHARS = 300
+
+# Shared compression dictionary of boilerplate that recurs across postings. It is
+# hand-written, not trained on captured postings; measure what it buys on real data
+# with benchmarks/compression_ratio.py before relying on a ratio. Stored rows record
+# the codec they were written with, so change the "-d1" suffix (and keep the old
+# bytes around) if this text is ever edited.
+POSTING_DICTIONARY = b"""Apply for this job Submit application Resume/CV Cover letter LinkedIn Profile Website
+Full name Email Phone Current company Current location Additional information
+Will you now or in the future require visa sponsorship? Are you legally authorized to work
+How did you hear about this job? What is your notice period? What are your salary expectations?
+When can you start? Start date Which languages do you speak? Gender Race Veteran status Disability status
+About us About the role About the team What you'll do What we're looking for What you'll bring
+Responsibilities Requirements Qualifications Minimum Qualifications Preferred Qualifications Nice to have
+Bachelor's degree in Computer Science, Engineering, Statistics, Mathematics or a related field
+years of experience in a fast-paced environment with strong written and verbal communication skills
+and the ability to work independently and as part of a cross-functional team with stakeholders
+Python, SQL, Java, JavaScript, TypeScript, React, AWS, GCP, Azure, Docker, Kubernetes, machine learning, data analysis
+Full-time Part-time Contract Internship Remote Hybrid On-site
+Benefits Competitive salary and equity, health, dental and vision insurance, 401(k) matching,
+flexible working hours, paid time off, parental leave, learning and development budget
+We are an equal opportunity employer and value diversity. All qualified applicants will receive
+consideration for employment without regard to race, color, religion, sex, sexual orientation,
+gender identity, national origin, age, disability, protected veteran status, or any other
+characteristic protected by law. We are committed to providing reasonable accommodations.
+"""
+
+ZLIB_CODEC = 'zlib-d1'
+ZSTD_CODEC = 'zstd-d1'
+# Plain UTF-8, used when compression would make a posting bigger (very short text)
+RAW_CODEC = 'raw'
+
+# The FTS table is contentless: the only copy of the full text is the compressed
+# blobs in `jobs`, so stale index entries are removed by hand in _write()
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    platform TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    salary TEXT NOT NULL DEFAULT '',
+    preview TEXT NOT NULL DEFAULT '',
+    codec TEXT NOT NULL,
+    description_z BLOB NOT NULL,
+    questions_z BLOB NOT NULL,
+    raw_bytes INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    analyzed_at TEXT NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_job_key ON jobs(job_key);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description, questions,
+    content='',
+    tokenize='porter unicode61'
+);
+"""
+
+
+def compress_text(text, codec=None):
+    """Compress text with the shared posting dictionary, returns (codec, blob)"""
+    data = text.encode('utf-8')
+    codec = codec or (ZSTD_CODEC if zstandard else ZLIB_CODEC)
+    if not data:
+        return codec, b''
+    if codec == RAW_CODEC:
+        return codec, data
+    if codec == ZSTD_CODEC:
+        compressor = zstandard.ZstdCompressor(
+            level=10, dict_data=zstandard.ZstdCompressionDict(POSTING_DICTIONARY)
+        )
+        return codec, compressor.compress(data)
+    if codec == ZLIB_CODEC:
+        compressor = zlib.compressobj(9, zdict=POSTING_DICTIONARY)
+        return codec, compressor.compress(data) + compressor.flush()
+    raise ValueError(f'Unknown codec: {codec}')
+
+
+def decompress_text(codec, blob):
+    """Inverse of compress_text()"""
+    if not blob:
+        return ''
+    if codec == RAW_CODEC:
+        return bytes(blob).decode('utf-8')
+    if codec == ZSTD_CODEC:
+        if zstandard is None:
+            raise RuntimeError('This posting was stored with zstd; install zstandard to read it')
+        decompressor = zstandard.ZstdDecompressor(
+            dict_data=zstandard.ZstdCompressionDict(POSTING_DICTIONARY)
+        )
+        return decompressor.decompress(blob).decode('utf-8')
+    if codec == ZLIB_CODEC:
+        decompressor = zlib.decompressobj(zdict=POSTING_DICTIONARY)
+        return (decompressor.decompress(blob) + decompressor.flush()).decode('utf-8')
+    raise ValueError(f'Unknown codec: {codec}')
+
+
+def make_preview(description, limit=PREVIEW_CHARS):
+    """First few lines of a description, cut on a word boundary"""
+    text = ' '.join(description.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0] + '…'
+
+
+def build_match_query(text):
+    """Turn free-form search text into an FTS5 MATCH expression"""
+    tokens = re.findall(r'\w+', text.lower())
+    # Quote every token so FTS5 operators in user input are treated as plain words,
+    # and prefix-match them so partial words ("eng", "pyth") still find postings
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+class JobIndex:
+    """SQLite FTS5 index of analyzed job postings"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Streamlit runs each session in its own thread, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _delete_fts(self, row):
+        """Drop a row's tokens; contentless FTS5 tables need the exact old values for this"""
+        self._conn.execute("""
+            INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description, questions)
+            VALUES ('delete', ?, ?, ?, ?, ?, ?)
+        """, (
+            row['id'], row['title'], row['company'], row['location'],
+            decompress_text(row['codec'], row['description_z']),
+            decompress_text(row['codec'], row['questions_z']),
+        ))
+
+    def upsert(self, url, platform, job):
+        """Add or refresh a single analyzed posting (a records.JobRecord) and its index entry"""
+        with self._lock, self._conn:
+            self._write(
+                url,
+                platform or '',
+                job.title,
+                job.company,
+                job.location,
+                job.salary,
+                job.description,
+                '\n'.join(job.questions),
+                datetime.now().strftime("%Y-%m-%d %H:%M"),
+            )
+
+    def upsert_rows(self, rows):
+        """Bulk upsert of exported rows (dicts) in one transaction, returns (added, updated)"""
+        added = updated = 0
+        with self._lock, self._conn:
+            for row in rows:
+                if self._write(
+                    row['url'],
+                    row.get('platform') or '',
+                    row.get('title') or '',
+                    row.get('company') or '',
+                    row.get('location') or '',
+                    row.get('salary') or '',
+                    row.get('description') or '',
+                    row.get('questions') or '',
+                    row.get('analyzed_at') or datetime.now().strftime("%Y-%m-%d %H:%M"),
+                ):
+                    added += 1
+                else:
+                    updated += 1
+        return added, updated
+
+    def iter_rows(self, chunk_rows=1000):
+        """Yield every posting with its full text, chunk_rows at a time, in insertion order"""
+        last_id = 0
+        while True:
+            with self._lock:
+                chunk = self._conn.execute("""
+                    SELECT id, job_key, url, platform, title, company, location, salary, analyzed_at,
+                           codec, description_z, questions_z
+                    FROM jobs WHERE id > ? ORDER BY id LIMIT ?
+                """, (last_id, chunk_rows)).fetchall()
+            if not chunk:
+                return
+            last_id = chunk[-1]['id']
+            yield [{
+                'job_key': row['job_key'],
+                'url': row['url'],
+                'platform': row['platform'],
+                'title': row['title'],
+                'company': row['company'],
+                'location': row['location'],
+                'salary': row['salary'],
+                'analyzed_at': row['analyzed_at'],
+                'description': decompress_text(row['codec'], row['description_z']),
+                'questions': decompress_text(row['codec'], row['questions_z']),
+            } for row in chunk]
+
+    def _write(self, url, platform, title, company, location, salary, description, questions, analyzed_at):
+        """Store one posting under its canonical job key, returns True if it was new.
+        Callers hold the lock and the transaction.
+        """
+        codec, description_z = compress_text(description)
+        _, questions_z = compress_text(questions, codec)
+        raw_bytes = len(description.encode('utf-8')) + len(questions.encode('utf-8'))
+        stored_bytes = len(description_z) + len(questions_z)
+        if stored_bytes >= raw_bytes:
+            codec, description_z = compress_text(description, RAW_CODEC)
+            _, questions_z = compress_text(questions, RAW_CODEC)
+            stored_bytes = raw_bytes
+
+        job_key = canonical_job_key(url)
+        old = self._conn.execute(
+            'SELECT id, title, company, location, codec, description_z, questions_z FROM jobs WHERE job_key = ?',
+            (job_key,)
+        ).fetchone()
+        if old:
+            self._delete_fts(old)
+
+        row_id = self._conn.execute("""
+            INSERT INTO jobs (job_key, url, platform, title, company, location, salary, preview, codec,
+                              description_z, questions_z, raw_bytes, stored_bytes, analyzed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_key) DO UPDATE SET
+                url = excluded.url,
+                platform = excluded.platform,
+                title = excluded.title,
+                company = excluded.company,
+                location = excluded.location,
+                salary = excluded.salary,
+                preview = excluded.preview,
+                codec = excluded.codec,
+                description_z = excluded.description_z,
+                questions_z = excluded.questions_z,
+                raw_bytes = excluded.raw_bytes,
+                stored_bytes = excluded.stored_bytes,
+                analyzed_at = excluded.analyzed_at
+            RETURNING id
+        """, (
+            job_key, url, platform, title, company, location, salary, make_preview(description), codec,
+            description_z, questions_z, raw_bytes, stored_bytes, analyzed_at,
+        )).fetchone()[0]
+        self._conn.execute("""
+            INSERT INTO jobs_fts(rowid, title, company, location, description, questions)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (row_id, title, company, location, description, questions))
+        return old is None
+
+    def search(self, text, limit=20):
+        """Return the best matching postings for the search text, best first"""
+        match = build_match_query(text)
+        if not match:
+            return []
+        weights = ', '.join(str(w) for w in RANK_WEIGHTS)
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT jobs.url, jobs.platform, jobs.title, jobs.company, jobs.location,
+                       jobs.salary, jobs.preview, jobs.raw_bytes, jobs.stored_bytes,
+                       jobs.analyzed_at, bm25(jobs_fts, {weights}) AS rank
+                FROM jobs_fts
+                JOIN jobs ON jobs.id = jobs_fts.rowid
+                WHERE jobs_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            """, (match, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_text(self, url):
+        """Decompress the full description and questions of one posting, or None if unknown"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT codec, description_z, questions_z FROM jobs WHERE job_key = ?',
+                (canonical_job_key(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        questions = decompress_text(row['codec'], row['questions_z'])
+        return {
+            'description': decompress_text(row['codec'], row['description_z']),
+            'questions': questions.split('\n') if questions else [],
+        }
+
+    def storage_stats(self):
+        """Raw vs compressed text size across the whole index"""
+        with self._lock:
+            count, raw, stored = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0), COALESCE(SUM(stored_bytes), 0) FROM jobs'
+            ).fetchone()
+        return {
+            'postings': count,
+            'raw_bytes': raw,
+            'stored_bytes': stored,
+            'raw_bytes_per_posting': raw / count if count else 0,
+            'stored_bytes_per_posting': stored / count if count else 0,
+            'ratio': raw / stored if stored else 0,
+        }
+
+    def count(self):
+        """Number of postings in the index"""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,298 @@
+"""
+Posting Liveness Monitor - Revalidates tracked job URLs in the background
+Detects postings that were closed, removed or moved after we applied
+"""
+
+import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from records import canonical_job_key
+
+logger = logging.getLogger(__name__)
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Posting states shown in the tracker
+OPEN = 'open'
+CLOSED = 'closed'
+MOVED = 'moved'
+UNKNOWN = 'unknown'
+ERROR = 'error'
+
+# Some job boards answer HEAD with these; fall back to a streamed GET
+HEAD_UNSUPPORTED = {403, 405, 501}
+
+# Redirects to a sign-in page (SSO hosts, LinkedIn's authwall) say nothing about the posting
+LOGIN_HOST = re.compile(r'^(login|signin|sso|auth|accounts)\.')
+LOGIN_PATH = re.compile(r'(^|/)(login|signin|sign-in|authwall|sso|saml|oauth2?|checkpoint)(/|\.|$)')
+
+
+def _host(url):
+    return urlparse(url).netloc.lower()
+
+
+def _site(url):
+    """Host as it appears in job keys (no www, known aliases folded)"""
+    return re.split(r'[/?]', canonical_job_key(url), 1)[0]
+
+
+def _is_login_redirect(parsed):
+    return bool(LOGIN_HOST.match(parsed.netloc.lower()) or LOGIN_PATH.search(parsed.path.lower()))
+
+
+def classify_response(url, response):
+    """Map a (redirect-followed) response for a posting URL to a posting state"""
+    if response.status_code in (404, 410):
+        return CLOSED
+    if response.status_code >= 400:
+        return ERROR
+    if not response.history or canonical_job_key(response.url) == canonical_job_key(url):
+        return OPEN
+    final = urlparse(response.url)
+    if _is_login_redirect(final):
+        return UNKNOWN
+    # Lever and Greenhouse send removed postings back to the company board on the
+    # same host, usually with ?error=true; anything else is a real move
+    original = urlparse(url)
+    if _site(url) == _site(response.url):
+        if 'error' in dict(parse_qsl(final.query)) or \
+                original.path.rstrip('/').startswith(final.path.rstrip('/') + '/'):
+            return CLOSED
+    return MOVED
+
+
+class LivenessMonitor:
+    """Keeps a posting state for every tracked URL and rechecks them on a jittered schedule"""
+
+    def __init__(self, interval=6 * 3600, jitter=0.2, retry_interval=900, batch_size=100,
+                 max_workers=16, per_host_concurrency=2, per_host_budget=20, budget_window=60,
+                 timeout=10, forget_after=24 * 3600):
+        self.interval = interval
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.per_host_concurrency = per_host_concurrency
+        # Each host gets at most per_host_budget checks per budget_window seconds
+        # (a token bucket); queued URLs beyond that wait for later windows
+        self.per_host_budget = per_host_budget
+        self.budget_window = budget_window
+        self.timeout = timeout
+        # URLs no session has shown in its tracker for this long are dropped
+        self.forget_after = forget_after
+
+        self._lock = threading.Lock()
+        self._states = {}
+        self._next_check = {}
+        self._last_seen = {}
+        self._host_slots = {}
+        # host -> (tokens left, time they were counted)
+        self._host_tokens = {}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+        # One pooled session so repeated checks reuse keep-alive connections per host
+        self.session = requests.Session()
+        self.session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=max(per_host_concurrency, 1))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _jittered(self, seconds):
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def track(self, urls):
+        """Register URLs for monitoring; new ones are spread over the first few minutes"""
+        now = time.time()
+        with self._lock:
+            for url in urls:
+                self._last_seen[url] = now
+                if url not in self._next_check:
+                    self._next_check[url] = now + random.uniform(0, 60)
+                    self._states.setdefault(url, {'state': UNKNOWN, 'checked_at': None})
+
+    def untrack(self, urls):
+        """Stop monitoring URLs and forget their state"""
+        with self._lock:
+            for url in urls:
+                self._states.pop(url, None)
+                self._next_check.pop(url, None)
+                self._last_seen.pop(url, None)
+
+    def queue(self, urls):
+        """Make URLs due now; the background thread checks them in budgeted batches"""
+        self.track(urls)
+        now = time.time()
+        with self._lock:
+            for url in urls:
+                self._next_check[url] = now
+        self._wake.set()
+
+    def pending(self, urls):
+        """How many of the URLs are waiting for a queued check"""
+        now = time.time()
+        with self._lock:
+            return sum(1 for url in urls if self._next_check.get(url, now + 1) <= now)
+
+    def status(self, url):
+        """Latest known state of a posting"""
+        with self._lock:
+            return dict(self._states.get(url, {'state': UNKNOWN, 'checked_at': None}))
+
+    def _tokens(self, host, now):
+        """Checks a host may still get right now; callers hold the lock"""
+        tokens, counted_at = self._host_tokens.get(host, (self.per_host_budget, now))
+        refill = (now - counted_at) * self.per_host_budget / self.budget_window
+        return min(self.per_host_budget, tokens + refill)
+
+    def due(self, now=None):
+        """Take the next batch of URLs whose check has passed and whose host has budget left"""
+        now = now or time.time()
+        batch = []
+        with self._lock:
+            candidates = sorted((t, url) for url, t in self._next_check.items() if t <= now)
+            tokens = {}
+            for _, url in candidates:
+                host = _host(url)
+                if host not in tokens:
+                    tokens[host] = self._tokens(host, now)
+                if tokens[host] < 1:
+                    continue
+                tokens[host] -= 1
+                batch.append(url)
+                if len(batch) >= self.batch_size:
+                    break
+            for host, left in tokens.items():
+                if left >= self.per_host_budget:
+                    self._host_tokens.pop(host, None)
+                else:
+                    self._host_tokens[host] = (left, now)
+        return batch
+
+    def check_due(self):
+        """Run one batch of due checks, returns the number of URLs checked"""
+        self._forget_unseen()
+        batch = self.due()
+        if batch:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(self._check_and_record, batch))
+        return len(batch)
+
+    def _forget_unseen(self):
+        cutoff = time.time() - self.forget_after
+        with self._lock:
+            stale = [url for url, seen in self._last_seen.items() if seen < cutoff]
+        if stale:
+            self.untrack(stale)
+
+    def _host_slot(self, host):
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host_concurrency)
+            return self._host_slots[host]
+
+    def _check_and_record(self, url):
+        with self._host_slot(_host(url)):
+            previous = self.status(url)
+            result = self.check_url(url, previous)
+        with self._lock:
+            if url not in self._next_check:
+                return  # untracked while the check was running
+            self._states[url] = result
+            delay = self.retry_interval if result['state'] == ERROR or result.get('stale') else self.interval
+            self._next_check[url] = time.time() + self._jittered(delay)
+
+    def check_url(self, url, previous=None):
+        """Revalidate one URL with HEAD, or a conditional GET that never reads the body"""
+        previous = previous or {}
+        headers = {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+
+        result = {
+            'state': ERROR,
+            'checked_at': datetime.now().strftime("%Y-%m-%d %H:%M"),
+            'http_status': None,
+            'final_url': url,
+            'etag': previous.get('etag'),
+            'last_modified': previous.get('last_modified'),
+        }
+        try:
+            response = self.session.head(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in HEAD_UNSUPPORTED:
+                response = self.session.get(url, headers=headers, timeout=self.timeout,
+                                            allow_redirects=True, stream=True)
+                response.close()
+        except requests.exceptions.RequestException as e:
+            result['error'] = str(e)
+            # Keep showing the last good state while the host is unreachable
+            if previous.get('state') in (OPEN, CLOSED, MOVED):
+                result['state'] = previous['state']
+                result['stale'] = True
+            return result
+
+        result['http_status'] = response.status_code
+        result['final_url'] = response.url
+        if response.status_code == 304:
+            result['state'] = previous.get('state') if previous.get('state') not in (None, UNKNOWN, ERROR) else OPEN
+            return result
+
+        result['state'] = classify_response(url, response)
+        result['etag'] = response.headers.get('ETag') or result['etag']
+        result['last_modified'] = response.headers.get('Last-Modified') or result['last_modified']
+        return result
+
+    def _seconds_until_due(self, poll=60):
+        """Time until a URL is due and its host has budget for it"""
+        now = time.time()
+        waits = []
+        with self._lock:
+            for url, t in self._next_check.items():
+                if t > now:
+                    waits.append(t - now)
+                else:
+                    missing = 1 - self._tokens(_host(url), now)
+                    waits.append(max(missing, 0) * self.budget_window / self.per_host_budget)
+        if not waits:
+            return poll
+        return min(max(min(waits), 1), poll)
+
+    def start(self):
+        """Start the background scheduler thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='liveness-monitor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self._seconds_until_due())
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.check_due()
+            except Exception:
+                # A bad batch must not kill the scheduler; failed URLs are retried later
+                logger.exception('Posting liveness check failed')
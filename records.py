@@ -0,0 +1,274 @@
+"""
+Records - Compact in-memory types for tracked applications and analyzed jobs
+Keeps per-session memory small when trackers grow large or many users are connected
+"""
+
+import hashlib
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+STATUSES = ("Applied", "Interview", "Rejected", "Offer", "Withdrawn")
+
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+# Dates are wall-clock times with no zone; counting minutes from a naive epoch keeps
+# times that fall in a DST gap or overlap exactly as entered
+EPOCH = datetime(1970, 1, 1)
+
+# Every platform detect_platform() can return; rows store the index into this tuple
+PLATFORMS = ("Lever", "Greenhouse", "Workday", "Glassdoor", "LinkedIn", "Indeed", "Unknown")
+
+
+# Query parameters that only say where a click came from. Everything else is kept,
+# because many boards carry the job id in the query (Indeed ?jk=, Glassdoor ?jl=,
+# Greenhouse embeds ?token= / ?gh_jid=).
+TRACKING_PARAMS = frozenset((
+    'gh_src', 'lever-source', 'lever-origin', 'source', 'src', 'ref', 'referrer',
+    'trk', 'trackingid', 'refid', 'from', 'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid',
+))
+
+
+# Hosts that serve the same postings under the same paths (Greenhouse moved boards here)
+HOST_ALIASES = {
+    'job-boards.greenhouse.io': 'boards.greenhouse.io',
+    'job-boards.eu.greenhouse.io': 'boards.eu.greenhouse.io',
+}
+
+
+def canonical_job_key(url):
+    """Key that identifies a posting regardless of scheme, www, tracking parameters or /apply suffix"""
+    parsed = urlparse(url.strip() if '://' in url else 'https://' + url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    host = HOST_ALIASES.get(host, host)
+    path = parsed.path.rstrip('/')
+    if path.lower().endswith('/apply'):
+        path = path[:-len('/apply')]
+    params = sorted(
+        (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_') and name.lower() not in TRACKING_PARAMS
+    )
+    return host + path + ('?' + urlencode(params) if params else '')
+
+
+@dataclass
+class Application:
+    """One tracked application"""
+    __slots__ = ('url', 'company', 'title', 'platform', 'date', 'status')
+    url: str
+    company: str
+    title: str
+    platform: str
+    date: str
+    status: str
+
+    def __post_init__(self):
+        # Interned so equal values across rows and sessions share one string object
+        self.platform = sys.intern(self.platform or 'Unknown')
+        self.status = sys.intern(self.status or STATUSES[0])
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class JobRecord:
+    """Parsed details of one job posting"""
+    __slots__ = ('title', 'company', 'location', 'description', 'requirements',
+                 'salary', 'job_type', 'questions', 'apply_url')
+    title: str
+    company: str
+    location: str
+    description: str
+    requirements: tuple
+    salary: str
+    job_type: str
+    questions: tuple
+    apply_url: str
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            title=data.get('title') or '',
+            company=data.get('company') or '',
+            location=data.get('location') or '',
+            description=data.get('description') or '',
+            requirements=tuple(data.get('requirements') or ()),
+            salary=data.get('salary') or '',
+            job_type=data.get('job_type') or '',
+            questions=tuple(data.get('questions') or ()),
+            apply_url=data.get('apply_url') or '',
+        )
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['requirements'] = list(self.requirements)
+        data['questions'] = list(self.questions)
+        return data
+
+
+def _encode_date(text):
+    """'YYYY-MM-DD HH:MM' -> minutes since 1970-01-01 00:00, no time zone involved"""
+    return (datetime.strptime(text, DATE_FORMAT) - EPOCH) // timedelta(minutes=1)
+
+
+def _code(values, value, field):
+    try:
+        return values.index(value)
+    except ValueError:
+        raise ValueError(f'Unknown {field}: {value!r}') from None
+
+
+def _decode_date(minutes):
+    return (EPOCH + timedelta(minutes=minutes)).strftime(DATE_FORMAT)
+
+
+class ApplicationTable:
+    """Column-oriented list of applications
+
+    Strings that vary per row are kept in plain lists; platform and status are
+    one-byte indexes into PLATFORMS / STATUSES and dates are minute timestamps
+    in typed arrays. Rows are materialised as Application objects only when read.
+    """
+
+    def __init__(self, rows=()):
+        self.urls = []
+        self.companies = []
+        self.titles = []
+        self.platforms = array('B')
+        self.statuses = array('B')
+        self.dates = array('q')
+        # job key -> row, only built once upsert() is used
+        self._keys = None
+        for row in rows:
+            self.append(row)
+
+    def __len__(self):
+        return len(self.urls)
+
+    def __bool__(self):
+        return bool(self.urls)
+
+    def __getitem__(self, i):
+        return Application(
+            url=self.urls[i],
+            company=self.companies[i],
+            title=self.titles[i],
+            platform=PLATFORMS[self.platforms[i]],
+            date=_decode_date(self.dates[i]),
+            status=STATUSES[self.statuses[i]],
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    @staticmethod
+    def _encode(app):
+        """Validate and encode a row before any column is touched; raises ValueError"""
+        if isinstance(app, dict):
+            app = Application(**{name: app.get(name) or '' for name in Application.__slots__})
+        return (
+            app.url,
+            app.company,
+            app.title,
+            _code(PLATFORMS, app.platform, 'platform'),
+            _code(STATUSES, app.status, 'status'),
+            _encode_date(app.date),
+        )
+
+    def _append_encoded(self, row):
+        url, company, title, platform, status, date = row
+        self.urls.append(url)
+        self.companies.append(company)
+        self.titles.append(title)
+        self.platforms.append(platform)
+        self.statuses.append(status)
+        self.dates.append(date)
+        if self._keys is not None:
+            self._keys[canonical_job_key(url)] = len(self.urls) - 1
+
+    def append(self, app):
+        """Add an Application (or a dict with the same keys); raises ValueError for invalid rows"""
+        self._append_encoded(self._encode(app))
+
+    def upsert(self, app, replace=True):
+        """Add an application, or replace the row with the same job key; returns True if added
+
+        With replace=False an existing row (its status and original date) is left as is.
+        """
+        row = self._encode(app)
+        i = self.find(row[0])
+        if i is None:
+            self._append_encoded(row)
+            return True
+        if replace:
+            (self.urls[i], self.companies[i], self.titles[i],
+             self.platforms[i], self.statuses[i], self.dates[i]) = row
+        return False
+
+    def find(self, url):
+        """Row index of the application with the same job key as url, or None"""
+        if self._keys is None:
+            self._keys = {canonical_job_key(u): i for i, u in enumerate(self.urls)}
+        return self._keys.get(canonical_job_key(url))
+
+    def set_status(self, i, status):
+        self.statuses[i] = _code(STATUSES, status, 'status')
+
+    def count_status(self, status):
+        return self.statuses.count(_code(STATUSES, status, 'status'))
+
+    def to_dicts(self):
+        return [app.to_dict() for app in self]
+
+
+class BlobStore:
+    """Process-wide, content-addressed store for uploaded file bytes
+
+    Sessions keep only the SHA-256 digest, so the same resume uploaded by many
+    sessions (or re-uploaded on every rerun) is held once. Least recently used
+    blobs are dropped silently once max_bytes is exceeded, after which get()
+    returns None for their digest; callers must treat that as "not uploaded".
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._blobs = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return digest
+            self._blobs[digest] = bytes(data)
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._blobs) > 1:
+                _, evicted = self._blobs.popitem(last=False)
+                self._size -= len(evicted)
+        return digest
+
+    def get(self, digest):
+        """Bytes for a digest, or None if it was never stored or has been evicted"""
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is not None:
+                self._blobs.move_to_end(digest)
+            return data
+
+    @property
+    def size(self):
+        return self._size
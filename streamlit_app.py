@@ -7,10 +7,18 @@ import streamlit as st
 import json
 import time
 import re
+import io
 from datetime import datetime
 import requests
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+from history_io import (
+    APPLICATION_FIELDS, FORMATS, JOB_FIELDS, MIME_TYPES,
+    format_for, import_applications, iter_application_chunks, read_chunks, write_chunks
+)
+from job_index import JobIndex
+from liveness import LivenessMonitor, CLOSED, MOVED
+from records import Application, ApplicationTable, BlobStore, JobRecord, STATUSES
 
 # Page configuration
 st.set_page_config(
@@ -67,14 +75,59 @@ if 'profile' not in st.session_state:
         'sponsorship': 'No'
     }
 
+# Last analysis (URL and fetch result) stays on screen across reruns, e.g. after
+# "Mark as Applied", without fetching the posting again
+if 'analyzed_url' not in st.session_state:
+    st.session_state.analyzed_url = None
+
+if 'analysis' not in st.session_state:
+    st.session_state.analysis = None
+
 if 'applications' not in st.session_state:
-    st.session_state.applications = []
+    st.session_state.applications = ApplicationTable()
+
+# Uploaded files live in the shared blob store; sessions only keep the content hash.
+# Nothing reads the bytes back yet (scripts ask for a manual upload), and a digest
+# whose blob was evicted resolves to None in get_blob_store().get()
+if 'resume_digest' not in st.session_state:
+    st.session_state.resume_digest = None
+
+if 'cover_letter_digest' not in st.session_state:
+    st.session_state.cover_letter_digest = None
+
+
+@st.cache_resource
+def get_job_index():
+    """Shared full-text index of analyzed postings (one per server process)"""
+    return JobIndex()
+
+
+# Every widget change reruns the script; cache index reads so reruns that don't
+# change the query skip the search and the full-table size scan
+@st.cache_data(ttl=60)
+def search_jobs(query):
+    """Best matching analyzed postings for a search, as plain dicts"""
+    return get_job_index().search(query, limit=25)
+
+
+@st.cache_data(ttl=60)
+def get_index_stats():
+    """Posting count and raw vs compressed size of the shared job index"""
+    return get_job_index().storage_stats()
 
-if 'resume_content' not in st.session_state:
-    st.session_state.resume_content = None
 
-if 'cover_letter_content' not in st.session_state:
-    st.session_state.cover_letter_content = None
+@st.cache_resource
+def get_blob_store():
+    """Uploaded file bytes shared by content hash across sessions"""
+    return BlobStore()
+
+
+@st.cache_resource
+def get_liveness_monitor():
+    """Background checker that revalidates tracked posting URLs (one per server process)"""
+    monitor = LivenessMonitor()
+    monitor.start()
+    return monitor
 
 
 def detect_platform(url):
@@ -192,7 +245,7 @@ def fetch_job_details(url):
         for selector in desc_selectors:
             el = soup.select_one(selector)
             if el:
-                job_data['description'] = el.get_text(separator='\n', strip=True)[:2000]
+                job_data['description'] = el.get_text(separator='\n', strip=True)
                 break
         
         # Try to find salary
@@ -217,7 +270,7 @@ def fetch_job_details(url):
             except:
                 pass
         
-        return {'success': True, 'data': job_data}
+        return {'success': True, 'data': JobRecord.from_dict(job_data)}
         
     except requests.exceptions.Timeout:
         return {'success': False, 'error': 'Request timed out. The job page took too long to respond.'}
@@ -495,12 +548,12 @@ with st.sidebar:
     st.markdown("### 📄 Documents")
     resume_file = st.file_uploader("Upload Resume (PDF)", type=['pdf', 'docx'])
     if resume_file:
-        st.session_state.resume_content = resume_file.read()
+        st.session_state.resume_digest = get_blob_store().put(resume_file.getvalue())
         st.success(f"✅ {resume_file.name} uploaded")
     
     cover_letter_file = st.file_uploader("Upload Cover Letter (Optional)", type=['pdf', 'docx', 'txt'])
     if cover_letter_file:
-        st.session_state.cover_letter_content = cover_letter_file.read()
+        st.session_state.cover_letter_digest = get_blob_store().put(cover_letter_file.getvalue())
         st.success(f"✅ {cover_letter_file.name} uploaded")
 
 
@@ -509,7 +562,7 @@ st.markdown('<p class="main-header">📄 Resume Auto Apply Agent</p>', unsafe_al
 st.markdown("Automatically fill job applications on ATS platforms like Lever, Greenhouse, Workday, and more.")
 
 # Tabs
-tab1, tab2, tab3, tab4 = st.tabs(["🚀 Apply Now", "📊 Application Tracker", "⚙️ Settings", "📖 Help"])
+tab1, tab2, tab_search, tab3, tab4 = st.tabs(["🚀 Apply Now", "📊 Application Tracker", "🔎 Job Search", "⚙️ Settings", "📖 Help"])
 
 with tab1:
     st.markdown("### Enter Job URL")
@@ -525,41 +578,53 @@ with tab1:
         analyze_btn = st.button("🔍 Analyze Job", use_container_width=True)
     
     if job_url and analyze_btn:
-        platform, icon = detect_platform(job_url)
-        
         # Fetch actual job details
         with st.spinner("🔍 Analyzing job posting..."):
-            job_result = fetch_job_details(job_url)
+            st.session_state.analysis = fetch_job_details(job_url)
+        st.session_state.analyzed_url = job_url
+    
+    if job_url and job_url == st.session_state.analyzed_url:
+        platform, icon = detect_platform(job_url)
+        job_result = st.session_state.analysis
         
         st.markdown("---")
         
         if job_result['success']:
             job_data = job_result['data']
             
+            # Keep every analyzed posting searchable from the Job Search tab
+            if analyze_btn:
+                try:
+                    get_job_index().upsert(job_url, platform, job_data)
+                    search_jobs.clear()
+                    get_index_stats.clear()
+                except Exception as e:
+                    st.warning(f"⚠️ Could not index this posting: {str(e)}")
+            
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.metric("Platform", f"{icon} {platform}")
             with col2:
-                st.metric("Company", job_data['company'] or 'Unknown')
+                st.metric("Company", job_data.company or 'Unknown')
             with col3:
-                st.metric("Location", job_data['location'] or 'Not specified')
+                st.metric("Location", job_data.location or 'Not specified')
             
             # Show job details
             st.markdown("### 📋 Job Details")
             
-            if job_data['title']:
-                st.markdown(f"**Position:** {job_data['title']}")
+            if job_data.title:
+                st.markdown(f"**Position:** {job_data.title}")
             
-            if job_data['salary']:
-                st.markdown(f"**💰 Salary:** {job_data['salary']}")
+            if job_data.salary:
+                st.markdown(f"**💰 Salary:** {job_data.salary}")
             
-            if job_data['description']:
+            if job_data.description:
                 with st.expander("📄 Job Description", expanded=False):
-                    st.markdown(job_data['description'][:1500] + "..." if len(job_data['description']) > 1500 else job_data['description'])
+                    st.markdown(job_data.description[:1500] + "..." if len(job_data.description) > 1500 else job_data.description)
             
-            if job_data['questions']:
-                with st.expander(f"❓ Application Questions ({len(job_data['questions'])} found)", expanded=True):
-                    for i, q in enumerate(job_data['questions'][:10], 1):
+            if job_data.questions:
+                with st.expander(f"❓ Application Questions ({len(job_data.questions)} found)", expanded=True):
+                    for i, q in enumerate(job_data.questions[:10], 1):
                         st.markdown(f"{i}. {q}")
             
             st.markdown("---")
@@ -589,7 +654,7 @@ with tab1:
                     st.markdown("### 🎯 Auto-Fill Script")
                     st.info("Copy the script below and paste it in your browser's console on the job application page.")
                     
-                    script = generate_application_script(platform, st.session_state.profile, job_data.get('apply_url', job_url))
+                    script = generate_application_script(platform, st.session_state.profile, job_data.apply_url or job_url)
                     
                     st.code(script, language='javascript')
                     
@@ -599,21 +664,26 @@ with tab1:
                             st.toast("Script copied! Paste it in browser console (F12 → Console)")
                     
                     with col2:
-                        apply_url = job_data.get('apply_url', job_url)
+                        apply_url = job_data.apply_url or job_url
                         st.link_button("🔗 Open Application", apply_url, use_container_width=True)
                     
                     with col3:
                         if st.button("✅ Mark as Applied", use_container_width=True):
-                            st.session_state.applications.append({
-                                'url': job_url,
-                                'company': job_data['company'],
-                                'title': job_data['title'],
-                                'platform': platform,
-                                'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
-                                'status': 'Applied'
-                            })
-                            st.success("Application tracked!")
-                            st.balloons()
+                            # Never touch an existing row: it may have moved on to Interview or Offer
+                            added = st.session_state.applications.upsert(Application(
+                                url=job_url,
+                                company=job_data.company,
+                                title=job_data.title,
+                                platform=platform,
+                                date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                                status='Applied'
+                            ), replace=False)
+                            if added:
+                                st.success("Application tracked!")
+                                st.balloons()
+                            else:
+                                existing = st.session_state.applications[st.session_state.applications.find(job_url)]
+                                st.info(f"Already tracked since {existing.date} (status: {existing.status})")
                     
                     st.markdown("---")
                     st.markdown("#### 📌 How to use:")
@@ -635,19 +705,33 @@ with tab2:
     st.markdown("### 📊 Application Tracker")
     
     if st.session_state.applications:
+        monitor = get_liveness_monitor()
+        tracked_urls = list(st.session_state.applications.urls)
+        monitor.track(tracked_urls)
+        posting_states = {url: monitor.status(url) for url in tracked_urls}
+        
         # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
+        col1, col2, col3, col4, col5 = st.columns(5)
         with col1:
             st.metric("Total Applications", len(st.session_state.applications))
         with col2:
-            applied = len([a for a in st.session_state.applications if a['status'] == 'Applied'])
+            applied = st.session_state.applications.count_status('Applied')
             st.metric("Applied", applied)
         with col3:
-            interviews = len([a for a in st.session_state.applications if a['status'] == 'Interview'])
+            interviews = st.session_state.applications.count_status('Interview')
             st.metric("Interviews", interviews)
         with col4:
-            offers = len([a for a in st.session_state.applications if a['status'] == 'Offer'])
+            offers = st.session_state.applications.count_status('Offer')
             st.metric("Offers", offers)
+        with col5:
+            gone = len([s for s in posting_states.values() if s['state'] in (CLOSED, MOVED)])
+            st.metric("Closed/Moved Postings", gone)
+        
+        if st.button("🔄 Recheck Postings"):
+            monitor.queue(tracked_urls)
+        pending = monitor.pending(tracked_urls)
+        if pending:
+            st.caption(f"⏳ {pending} postings queued for a liveness check. Results show up here as checks complete.")
         
         st.markdown("---")
         
@@ -656,26 +740,81 @@ with tab2:
             with st.container():
                 col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
                 with col1:
-                    st.write(f"**{app['company']}**")
-                    st.caption(app['platform'])
+                    st.write(f"**{app.company}**")
+                    st.caption(app.platform)
                 with col2:
-                    st.write(app['date'])
+                    st.write(app.date)
+                    posting = posting_states[app.url]
+                    if posting['state'] == CLOSED:
+                        st.caption(f"🚫 Posting closed (checked {posting['checked_at']})")
+                    elif posting['state'] == MOVED:
+                        st.caption(f"↪️ Posting moved to {posting['final_url']}")
                 with col3:
                     new_status = st.selectbox(
                         "Status",
-                        ["Applied", "Interview", "Rejected", "Offer", "Withdrawn"],
-                        index=["Applied", "Interview", "Rejected", "Offer", "Withdrawn"].index(app['status']),
+                        STATUSES,
+                        index=STATUSES.index(app.status),
                         key=f"status_{i}",
                         label_visibility="collapsed"
                     )
                     idx = len(st.session_state.applications) - 1 - i
-                    st.session_state.applications[idx]['status'] = new_status
+                    st.session_state.applications.set_status(idx, new_status)
                 with col4:
-                    st.link_button("🔗", app['url'])
+                    st.link_button("🔗", app.url)
                 st.markdown("---")
     else:
         st.info("No applications tracked yet. Start applying to jobs in the 'Apply Now' tab!")
 
+with tab_search:
+    st.markdown("### 🔎 Job Search")
+    
+    job_index = get_job_index()
+    search_query = st.text_input(
+        "Search analyzed jobs",
+        placeholder="e.g. data scientist python remote",
+        label_visibility="collapsed"
+    )
+    
+    if search_query:
+        start = time.perf_counter()
+        results = search_jobs(search_query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats = get_index_stats()
+        st.caption(f"{len(results)} results from {stats['postings']} analyzed jobs in {elapsed_ms:.1f} ms")
+        
+        if stats['postings']:
+            st.caption(
+                f"💾 Full text: {stats['stored_bytes_per_posting']:,.0f} bytes/posting compressed vs "
+                f"{stats['raw_bytes_per_posting']:,.0f} raw ({stats['ratio']:.1f}x smaller)"
+            )
+        
+        for i, job in enumerate(results):
+            with st.container():
+                col1, col2, col3 = st.columns([4, 2, 1])
+                with col1:
+                    st.write(f"**{job['title'] or 'Untitled position'}**")
+                    st.caption(f"{job['company'] or 'Unknown'} · {job['location'] or 'Not specified'} · {job['platform']}")
+                    if job['preview']:
+                        st.write(job['preview'])
+                    # Full text is decompressed only when asked for
+                    if st.toggle("Show full posting", key=f"full_text_{job['url']}"):
+                        full_text = job_index.get_text(job['url'])
+                        st.markdown(full_text['description'] or '_No description found_')
+                        if full_text['questions']:
+                            st.markdown("**Application Questions**")
+                            for n, q in enumerate(full_text['questions'], 1):
+                                st.markdown(f"{n}. {q}")
+                with col2:
+                    st.write(job['analyzed_at'])
+                    if job['salary']:
+                        st.caption(f"💰 {job['salary']}")
+                    st.caption(f"💾 {job['stored_bytes']:,} B stored ({job['raw_bytes']:,} B raw)")
+                with col3:
+                    st.link_button("🔗", job['url'])
+                st.markdown("---")
+    else:
+        st.info(f"{get_index_stats()['postings']} analyzed jobs indexed. Every job you analyze in the 'Apply Now' tab is added automatically.")
+
 with tab3:
     st.markdown("### ⚙️ Settings")
     
@@ -707,7 +846,7 @@ with tab3:
         
         if st.session_state.applications:
             if st.button("📤 Export Applications"):
-                apps_json = json.dumps(st.session_state.applications, indent=2)
+                apps_json = json.dumps(st.session_state.applications.to_dicts(), indent=2)
                 st.download_button(
                     "Download Applications JSON",
                     apps_json,
@@ -715,13 +854,56 @@ with tab3:
                     "application/json"
                 )
     
+    st.markdown("---")
+    st.markdown("#### 📦 Bulk History Export/Import")
+    st.caption("CSV or Parquet files, readable directly with pandas or DuckDB. Imports update existing jobs instead of duplicating them.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        export_dataset = st.selectbox("Export", ["Applications", "Analyzed Jobs"])
+        export_format = st.selectbox("Format", FORMATS)
+        if 'parquet' not in FORMATS:
+            st.caption("Install `pyarrow` to enable Parquet.")
+        
+        if st.button("📤 Export History"):
+            # Streamlit serves downloads from memory; for very large job histories use `python history_io.py export`
+            export_file = io.BytesIO()
+            if export_dataset == "Applications":
+                rows = write_chunks(iter_application_chunks(st.session_state.applications), APPLICATION_FIELDS, export_format, export_file)
+                file_name = f"applications.{export_format}"
+            else:
+                rows = write_chunks(get_job_index().iter_rows(), JOB_FIELDS, export_format, export_file)
+                file_name = f"analyzed_jobs.{export_format}"
+            st.download_button(
+                f"Download {file_name} ({rows} rows)",
+                export_file,
+                file_name,
+                MIME_TYPES[export_format]
+            )
+    
+    with col2:
+        history_file = st.file_uploader("Import Applications", type=['csv', 'parquet'])
+        # The analyzed-jobs index is shared by every session, so only the server's
+        # operator may bulk-load it: `python history_io.py import jobs.parquet`
+        st.caption("Analyzed jobs are shared by all users and can only be imported from the command line.")
+        
+        if history_file and st.button("📥 Import History"):
+            try:
+                chunks = read_chunks(history_file, format_for(history_file.name))
+                with st.spinner("Importing..."):
+                    added, updated, skipped = import_applications(st.session_state.applications, chunks)
+                st.success(f"Imported {history_file.name}: {added} added, {updated} updated, {skipped} skipped")
+            except Exception as e:
+                st.error(f"Could not import {history_file.name}: {str(e)}")
+    
     st.markdown("---")
     st.markdown("#### 🔄 Reset Data")
     
     col1, col2 = st.columns(2)
     with col1:
         if st.button("🗑️ Clear Applications", type="secondary"):
-            st.session_state.applications = []
+            st.session_state.applications = ApplicationTable()
             st.success("Applications cleared!")
     with col2:
         if st.button("🗑️ Reset Profile", type="secondary"):
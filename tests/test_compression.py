@@ -0,0 +1,55 @@
+import pytest
+
+from job_index import RAW_CODEC, ZLIB_CODEC, ZSTD_CODEC, JobIndex, compress_text, decompress_text
+from records import JobRecord
+
+DESCRIPTION = ('About the role\nWe are looking for a backend engineer with 5+ years of Python '
+               'and SQL experience. Héllo — unicode survives too.\n') * 20
+
+
+@pytest.mark.parametrize('codec', [ZLIB_CODEC, RAW_CODEC])
+def test_round_trip(codec):
+    stored_codec, blob = compress_text(DESCRIPTION, codec)
+    assert stored_codec == codec
+    assert decompress_text(codec, blob) == DESCRIPTION
+    assert compress_text('', codec) == (codec, b'')
+    assert decompress_text(codec, b'') == ''
+
+
+def test_zstd_round_trip():
+    pytest.importorskip('zstandard')
+    codec, blob = compress_text(DESCRIPTION, ZSTD_CODEC)
+    assert len(blob) < len(DESCRIPTION.encode('utf-8'))
+    assert decompress_text(codec, blob) == DESCRIPTION
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        compress_text('text', 'lz4')
+    with pytest.raises(ValueError):
+        decompress_text('lz4', b'x')
+
+
+def test_short_description_is_never_stored_bigger():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever',
+                 JobRecord.from_dict({'title': 'Engineer', 'description': 'Remote.'}))
+    stats = index.storage_stats()
+    assert stats['stored_bytes'] <= stats['raw_bytes']
+    assert index.get_text('https://jobs.lever.co/acme/1')['description'] == 'Remote.'
+
+
+def test_get_text_and_storage_stats():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', JobRecord.from_dict({
+        'title': 'Engineer', 'description': DESCRIPTION, 'questions': ['Notice period?', 'Start date?'],
+    }))
+    assert index.get_text('http://www.jobs.lever.co/acme/1/apply') == {
+        'description': DESCRIPTION, 'questions': ['Notice period?', 'Start date?'],
+    }
+    assert index.get_text('https://jobs.lever.co/acme/2') is None
+    stats = index.storage_stats()
+    assert stats['postings'] == 1
+    assert stats['stored_bytes'] < stats['raw_bytes']
+    assert stats['ratio'] == stats['raw_bytes'] / stats['stored_bytes']
+    assert JobIndex(':memory:').storage_stats()['ratio'] == 0
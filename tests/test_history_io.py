@@ -0,0 +1,108 @@
+import io
+
+import pytest
+
+from history_io import (
+    APPLICATION_FIELDS, FORMATS, JOB_FIELDS,
+    format_for, import_applications, import_jobs, iter_application_chunks, read_chunks, write_chunks
+)
+from job_index import JobIndex
+from records import ApplicationTable, canonical_job_key
+
+
+def make_app(url, **overrides):
+    row = {'url': url, 'company': 'Acme', 'title': 'Data Scientist', 'platform': 'Lever',
+           'date': '2026-01-02 10:30', 'status': 'Applied'}
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://jobs.lever.co/acme/1', 'jobs.lever.co/acme/1'),
+    ('http://www.Jobs.Lever.co/acme/1/apply/', 'jobs.lever.co/acme/1'),
+    ('https://jobs.lever.co/acme/1?lever-source=LinkedIn&utm_source=x', 'jobs.lever.co/acme/1'),
+    ('jobs.lever.co/acme/1#apply', 'jobs.lever.co/acme/1'),
+    ('https://www.indeed.com/viewjob?jk=abc123&from=serp', 'indeed.com/viewjob?jk=abc123'),
+    ('https://www.glassdoor.com/job-listing/ds?jl=1009&src=GD', 'glassdoor.com/job-listing/ds?jl=1009'),
+    ('https://boards.greenhouse.io/embed/job_app?token=42&for=acme',
+     'boards.greenhouse.io/embed/job_app?for=acme&token=42'),
+    ('https://job-boards.greenhouse.io/acme/jobs/123', 'boards.greenhouse.io/acme/jobs/123'),
+])
+def test_canonical_job_key(url, key):
+    assert canonical_job_key(url) == key
+
+
+def test_job_ids_in_query_are_different_jobs():
+    table = ApplicationTable()
+    assert table.upsert(make_app('https://www.indeed.com/viewjob?jk=aaa', platform='Indeed'))
+    assert table.upsert(make_app('https://www.indeed.com/viewjob?jk=bbb', platform='Indeed'))
+    assert len(table) == 2
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_applications_round_trip(fmt):
+    table = ApplicationTable([
+        make_app('https://jobs.lever.co/acme/1'),
+        make_app('https://boards.greenhouse.io/acme/jobs/2', platform='Greenhouse', status='Interview',
+                 company='Acme, "Inc"\nNYC'),
+    ])
+    buffer = io.BytesIO()
+    assert write_chunks(iter_application_chunks(table, chunk_rows=1), APPLICATION_FIELDS, fmt, buffer) == 2
+
+    buffer.seek(0)
+    restored = ApplicationTable()
+    assert import_applications(restored, read_chunks(buffer, fmt, chunk_rows=1)) == (2, 0, 0)
+    assert restored.to_dicts() == table.to_dicts()
+
+    # Importing the same file again updates instead of duplicating
+    buffer.seek(0)
+    assert import_applications(restored, read_chunks(buffer, fmt)) == (0, 2, 0)
+    assert len(restored) == 2
+
+
+def test_import_skips_invalid_rows_without_corrupting_the_table():
+    rows = [
+        make_app('https://jobs.lever.co/acme/1'),
+        make_app('https://jobs.lever.co/acme/2', date='2026-01-02'),
+        make_app('https://jobs.lever.co/acme/3', date=''),
+        make_app('https://jobs.lever.co/acme/4', status='Ghosted'),
+        make_app('https://jobs.lever.co/acme/5', platform='Taleo'),
+        make_app(''),
+        make_app('https://jobs.lever.co/acme/6'),
+    ]
+    table = ApplicationTable()
+    assert import_applications(table, [rows]) == (2, 0, 5)
+    assert [a.url for a in table] == ['https://jobs.lever.co/acme/1', 'https://jobs.lever.co/acme/6']
+    assert {len(table.urls), len(table.platforms), len(table.statuses), len(table.dates)} == {2}
+
+
+def test_import_bad_row_does_not_overwrite_existing_application():
+    table = ApplicationTable([make_app('https://jobs.lever.co/acme/1', status='Offer')])
+    assert import_applications(table, [[make_app('https://jobs.lever.co/acme/1', date='bad')]]) == (0, 0, 1)
+    assert table[0].status == 'Offer'
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_jobs_round_trip(fmt):
+    source = JobIndex(':memory:')
+    source.upsert_rows([
+        {'url': 'https://jobs.lever.co/acme/1', 'platform': 'Lever', 'title': 'Data Scientist',
+         'description': 'Python and SQL\n' * 500, 'questions': 'Visa?\nNotice period?',
+         'analyzed_at': '2026-01-02 10:30'},
+        {'url': 'https://www.indeed.com/viewjob?jk=abc', 'platform': 'Indeed', 'title': 'Java Developer',
+         'description': 'Java', 'questions': '', 'analyzed_at': '2026-01-03 09:00'},
+    ])
+    buffer = io.BytesIO()
+    assert write_chunks(source.iter_rows(chunk_rows=1), JOB_FIELDS, fmt, buffer) == 2
+
+    buffer.seek(0)
+    target = JobIndex(':memory:')
+    assert import_jobs(target, read_chunks(buffer, fmt)) == (2, 0, 0)
+    assert [r for c in target.iter_rows() for r in c] == [r for c in source.iter_rows() for r in c]
+    assert [r['title'] for r in target.search('python')] == ['Data Scientist']
+
+
+def test_format_for():
+    assert format_for('history.CSV') == 'csv'
+    with pytest.raises(ValueError):
+        format_for('history.xlsx')
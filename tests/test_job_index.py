@@ -0,0 +1,73 @@
+import sqlite3
+
+from job_index import SCHEMA_VERSION, JobIndex, build_match_query
+from records import JobRecord
+
+
+def job(title, description='', questions=()):
+    return JobRecord.from_dict({'title': title, 'company': 'Acme', 'description': description,
+                                'questions': list(questions)})
+
+
+def titles(index, query):
+    return sorted(r['title'] for r in index.search(query))
+
+
+def test_build_match_query_quotes_user_input():
+    assert build_match_query('Data  scien') == '"data"* "scien"*'
+    assert build_match_query('AND OR "NEAR(') == '"and"* "or"* "near"*'
+    assert build_match_query('  !! ') == ''
+
+
+def test_search_ranks_title_matches_first():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Office Manager', 'works with python engineers'))
+    index.upsert('https://jobs.lever.co/acme/2', 'Lever', job('Python Engineer', 'backend services'))
+    results = index.search('pyth')
+    assert [r['title'] for r in results] == ['Python Engineer', 'Office Manager']
+    assert index.search('') == []
+    assert index.search('rust') == []
+
+
+def test_questions_are_searchable():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Analyst', questions=['Do you require visa sponsorship?']))
+    assert titles(index, 'sponsorship') == ['Analyst']
+
+
+def test_reanalysis_replaces_old_tokens():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Data Scientist', 'python'))
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Data Engineer', 'scala'))
+    assert index.count() == 1
+    assert titles(index, 'python') == []
+    assert titles(index, 'scientist') == []
+    assert titles(index, 'scala') == ['Data Engineer']
+
+
+def test_index_persists_across_reopen(tmp_path):
+    path = str(tmp_path / 'nested' / 'index.db')
+    index = JobIndex(path)
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Data Scientist', 'python'))
+    index.close()
+    assert titles(JobIndex(path), 'python') == ['Data Scientist']
+    conn = sqlite3.connect(path)
+    assert conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION == 1
+    conn.close()
+
+
+def test_jobs_with_ids_in_query_are_kept_apart():
+    index = JobIndex(':memory:')
+    index.upsert('https://www.indeed.com/viewjob?jk=aaa', 'Indeed', job('Python Developer', 'python'))
+    index.upsert('https://www.indeed.com/viewjob?jk=bbb', 'Indeed', job('Java Developer', 'java'))
+    assert index.count() == 2
+    assert titles(index, 'python') == ['Python Developer']
+
+
+def test_same_posting_under_another_url_is_updated():
+    index = JobIndex(':memory:')
+    index.upsert('https://jobs.lever.co/acme/1', 'Lever', job('Old', 'alpha'))
+    index.upsert('https://jobs.lever.co/acme/1/apply?lever-source=LinkedIn', 'Lever', job('New', 'beta'))
+    assert index.count() == 1
+    assert titles(index, 'alpha') == []
+    assert titles(index, 'beta') == ['New']
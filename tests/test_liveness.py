@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from liveness import CLOSED, ERROR, MOVED, OPEN, UNKNOWN, LivenessMonitor, classify_response
+
+
+class FakeResponse:
+    def __init__(self, status_code, url, redirected=False):
+        self.status_code = status_code
+        self.url = url
+        self.history = [object()] if redirected else []
+
+
+LEVER = 'https://jobs.lever.co/acme/1'
+WORKDAY = 'https://acme.wd5.myworkdayjobs.com/en-US/careers/job/Engineer_R1'
+INDEED = 'https://www.indeed.com/viewjob?jk=abc123'
+
+
+@pytest.mark.parametrize('url, status, final_url, redirected, state', [
+    (LEVER, 200, LEVER, False, OPEN),
+    (LEVER, 404, LEVER, False, CLOSED),
+    (LEVER, 410, LEVER, False, CLOSED),
+    (LEVER, 500, LEVER, False, ERROR),
+    (LEVER, 200, LEVER + '/', True, OPEN),
+    (LEVER, 200, LEVER + '?lever-origin=applied', True, OPEN),
+    (LEVER, 200, 'https://jobs.lever.co/acme?error=true', True, CLOSED),
+    (LEVER, 200, 'https://jobs.lever.co/acme', True, CLOSED),
+    (LEVER, 200, 'https://careers.acme.com/jobs/1', True, MOVED),
+    (LEVER, 200, 'https://careers.acme.com/', True, MOVED),
+    ('https://glassdoor.com/job-listing/ds?jl=1009', 200,
+     'https://www.glassdoor.com/job-listing/ds?jl=1009', True, OPEN),
+    ('https://boards.greenhouse.io/acme/jobs/123', 200,
+     'https://job-boards.greenhouse.io/acme/jobs/123', True, OPEN),
+    (WORKDAY, 200, 'https://sso.acme.com/', True, UNKNOWN),
+    (WORKDAY, 200, 'https://acme.wd5.myworkdayjobs.com/en-US/careers/login', True, UNKNOWN),
+    ('https://www.linkedin.com/jobs/view/3912345678', 200,
+     'https://www.linkedin.com/authwall?trk=gf&sessionRedirect=https%3A%2F%2Fwww.linkedin.com%2Fjobs', True, UNKNOWN),
+    (INDEED, 200, INDEED, True, OPEN),
+    (INDEED, 200, 'https://www.indeed.com/viewjob?jk=def456', True, MOVED),
+])
+def test_classify_response(url, status, final_url, redirected, state):
+    response = FakeResponse(status, final_url, redirected)
+    assert classify_response(url, response) == state
+
+
+def test_due_respects_batch_size_and_per_host_budget():
+    monitor = LivenessMonitor(batch_size=5, per_host_budget=2, budget_window=60)
+    urls = [f'https://jobs.lever.co/acme/{i}' for i in range(4)] + [f'https://boards.greenhouse.io/a/{i}' for i in range(4)]
+    monitor.queue(urls)
+    now = time.time()
+    batch = monitor.due(now)
+    assert len(batch) == 4
+    assert sum('lever' in url for url in batch) == 2
+    assert monitor.pending(urls) == 8
+
+
+def test_per_host_budget_spans_batches():
+    monitor = LivenessMonitor(per_host_budget=2, budget_window=60)
+    urls = [f'https://jobs.lever.co/acme/{i}' for i in range(10)]
+    monitor.queue(urls)
+    now = time.time()
+    assert len(monitor.due(now)) == 2
+    # The budget is spent until the window refills it, however often batches run
+    assert monitor.due(now + 1) == []
+    assert monitor._seconds_until_due() >= 25
+    assert len(monitor.due(now + 30)) == 1
+    assert len(monitor.due(now + 120)) == 2
+
+
+def test_untrack_forgets_state():
+    monitor = LivenessMonitor()
+    monitor.queue(['https://jobs.lever.co/acme/1'])
+    monitor.untrack(['https://jobs.lever.co/acme/1'])
+    assert monitor.due() == []
+    assert monitor.status('https://jobs.lever.co/acme/1')['state'] == UNKNOWN
+
+
+def test_unseen_urls_are_forgotten():
+    monitor = LivenessMonitor(forget_after=60)
+    monitor.track(['https://jobs.lever.co/acme/1'])
+    monitor._last_seen['https://jobs.lever.co/acme/1'] = time.time() - 120
+    monitor._forget_unseen()
+    assert monitor.due(now=time.time() + 3600) == []
+
+
+def test_scheduler_logs_failures(caplog):
+    monitor = LivenessMonitor()
+
+    def broken():
+        raise RuntimeError('boom')
+
+    monitor.check_due = broken
+    monitor.start()
+    monitor.queue(['https://jobs.lever.co/acme/1'])
+    deadline = time.time() + 5
+    while 'boom' not in caplog.text and time.time() < deadline:
+        time.sleep(0.05)
+    monitor.stop()
+    assert 'Posting liveness check failed' in caplog.text
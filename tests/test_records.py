@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from records import Application, ApplicationTable, BlobStore, JobRecord, PLATFORMS
+
+
+def make_app(url='https://jobs.lever.co/acme/1', **overrides):
+    row = {
+        'url': url,
+        'company': 'Acme',
+        'title': 'Data Scientist',
+        'platform': 'Lever',
+        'date': '2026-01-02 10:30',
+        'status': 'Applied',
+    }
+    row.update(overrides)
+    return row
+
+
+def column_lengths(table):
+    return {len(c) for c in (table.urls, table.companies, table.titles,
+                             table.platforms, table.statuses, table.dates)}
+
+
+def test_append_round_trips_rows():
+    table = ApplicationTable([make_app(), make_app('https://boards.greenhouse.io/acme/jobs/2',
+                                                   platform='Greenhouse', status='Offer')])
+    assert len(table) == 2
+    assert table[0] == Application(**make_app())
+    assert table.to_dicts()[1]['platform'] == 'Greenhouse'
+    assert [a.status for a in reversed(table)] == ['Offer', 'Applied']
+    assert table.count_status('Offer') == 1
+
+
+@pytest.mark.parametrize('bad', [
+    {'date': '2026-01-02'},
+    {'date': ''},
+    {'status': 'Ghosted'},
+    {'platform': 'Taleo'},
+])
+def test_invalid_append_leaves_columns_untouched(bad):
+    table = ApplicationTable([make_app()])
+    with pytest.raises(ValueError):
+        table.append(make_app('https://jobs.lever.co/acme/2', **bad))
+    assert column_lengths(table) == {1}
+    assert len(list(table)) == 1
+
+
+def test_invalid_upsert_leaves_existing_row_untouched():
+    table = ApplicationTable()
+    table.upsert(make_app())
+    with pytest.raises(ValueError):
+        table.upsert(make_app(company='Changed', date='not a date'))
+    assert table[0].company == 'Acme'
+
+
+def test_upsert_replaces_same_job_and_adds_new_ones():
+    table = ApplicationTable([make_app()])
+    assert table.upsert(make_app('https://jobs.lever.co/acme/1/apply', status='Interview')) is False
+    assert table.upsert(make_app('https://jobs.lever.co/acme/2')) is True
+    assert len(table) == 2
+    assert table[0].status == 'Interview'
+    # Rows appended after the key index exists are found again
+    assert table.upsert(make_app('https://jobs.lever.co/acme/2', status='Offer')) is False
+    assert len(table) == 2
+
+
+def test_upsert_without_replace_keeps_existing_row():
+    table = ApplicationTable([make_app(status='Offer')])
+    again = make_app('https://jobs.lever.co/acme/1?utm_source=x', date='2026-03-01 09:00')
+    assert table.upsert(again, replace=False) is False
+    assert table[0].status == 'Offer'
+    assert table[0].date == '2026-01-02 10:30'
+    assert table.find('https://jobs.lever.co/acme/2') is None
+    assert table.upsert(make_app('https://jobs.lever.co/acme/2'), replace=False) is True
+    assert table.find('https://jobs.lever.co/acme/2') == 1
+
+
+@pytest.mark.parametrize('date', ['2026-03-08 02:30', '2026-11-01 01:30', '1969-12-31 23:59', '2026-01-02 10:30'])
+def test_dates_round_trip_in_any_time_zone(monkeypatch, date):
+    # 2026-03-08 02:30 does not exist in New York and 2026-11-01 01:30 happens twice
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    try:
+        table = ApplicationTable([make_app(date=date)])
+        assert table[0].date == date
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_every_platform_fits_the_table():
+    table = ApplicationTable(make_app(f'https://example.com/{p}', platform=p) for p in PLATFORMS)
+    assert [a.platform for a in table] == list(PLATFORMS)
+
+
+def test_set_status_rejects_unknown_status():
+    table = ApplicationTable([make_app()])
+    table.set_status(0, 'Rejected')
+    with pytest.raises(ValueError):
+        table.set_status(0, 'Maybe')
+    assert table[0].status == 'Rejected'
+
+
+def test_job_record_from_dict_fills_defaults():
+    job = JobRecord.from_dict({'title': 'DS', 'questions': ['Visa?']})
+    assert job.company == ''
+    assert job.questions == ('Visa?',)
+    assert job.to_dict()['questions'] == ['Visa?']
+
+
+def test_blob_store_dedupes_and_evicts():
+    store = BlobStore(max_bytes=10)
+    first = store.put(b'123456')
+    assert store.put(b'123456') == first
+    assert store.size == 6
+    second = store.put(b'abcdef')
+    assert store.get(first) is None
+    assert store.get(second) == b'abcdef'